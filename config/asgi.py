@@ -3,6 +3,12 @@ ASGI config for config project.
 
 このファイルは、プロジェクトのASGI (Asynchronous Server Gateway Interface) アプリケーションを
 設定します。非同期サーバー（例: Daphne, Uvicorn）がアプリケーションを呼び出すためのエントリーポイントです。
+
+📝 Note: 本番環境のエントリーポイントは config/wsgi.py (Gunicorn で起動) です。
+このプロジェクトのビューと WhiteNoiseMiddleware はすべて同期処理のため、ASGI で動かすと
+Django が sync_to_async(thread_sensitive=True) で1ワーカーあたり1つのスレッドに順番に実行させます。
+リクエストは並行処理されず、同期/非同期の切り替えのオーバーヘッドだけが加わるため、
+ビューを非同期化するまでは ASGI サーバーでの運用は推奨しません。
 """
 
 import os
@@ -151,6 +151,15 @@ STATIC_URL = 'static/'
 # モデルの主キーのデフォルトタイプを指定。
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# 認証バックエンド。ログインユーザーの取得時に不要なフィールドを読み込まない独自バックエンドを使用。
+# 📝 Note: セッションにはログイン時のバックエンドのパスが保存され、一覧に無いパスのセッションは無効になる。
+#          導入前にログインしたユーザー (ModelBackend のセッション) がログアウトされないよう、2番目に残す。
+#          新しいログインは先頭の DeferredFieldsModelBackend で処理される。
+AUTHENTICATION_BACKENDS = [
+    'tasks.backends.DeferredFieldsModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 # ログイン成功後のリダイレクト先URL。
 # '/' はプロジェクトルート（タスク一覧ページ）を指す。
 LOGIN_REDIRECT_URL = '/'
@@ -0,0 +1,55 @@
+"""
+Test settings for config project.
+テスト実行用の設定ファイル。
+
+config/settings.py の設定をすべて引き継ぎ、テストの実行時間を短縮するための項目のみを上書きする。
+
+使用方法:
+    python manage.py test --settings=config.test_settings
+"""
+
+from .settings import *  # noqa: F401,F403
+
+
+# ==============================================================================
+# 1. データベース設定 (Database Configuration)
+# ==============================================================================
+
+# 環境変数 DATABASE_URL の有無に関わらず、インメモリの SQLite を使用する。
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+
+# マイグレーションを無効化するためのクラス。
+# すべてのアプリに対して None を返すことで、マイグレーションを実行せずに現在のモデルから直接テーブルを作成する。
+class DisableMigrations:
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+
+# ==============================================================================
+# 2. パスワード設定 (Password Configuration)
+# ==============================================================================
+
+# テスト専用: ユーザー作成・ログイン時のハッシュ計算を軽くするため、高速な MD5 を使用する。
+# SECURITY WARNING: 本番環境では絶対に使用しないこと。
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# ==============================================================================
+# 3. デバッグ設定 (Debug Configuration)
+# ==============================================================================
+
+DEBUG = False
\ No newline at end of file
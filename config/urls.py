@@ -3,27 +3,19 @@ URL configuration for config project.
 プロジェクト全体のURL設定ファイル。
 
 `urlpatterns` リストが、URLと対応するビューをルーティングする役割を担う。
+
+📝 Note: URLはすべて path() と組み込みのコンバータ (<int:pk> など) で定義し、re_path (正規表現) は使用しない。
+         (tasks.tests.URLConfTest で確認している)
 """
 from django.contrib import admin
 from django.urls import path, include, reverse_lazy
 from django.contrib.auth import views as auth_views
 from django.views.generic.base import TemplateView
+from django.views.decorators.cache import cache_control, never_cache
 
-# tasksアプリケーションから必要なビューをインポート
-from tasks.views import (
-    UserRegisterView, 
-    TaskListView, 
-    TaskCreateView, 
-    TaskUpdateView, 
-    TaskDeleteView, 
-    TrashView, 
-    TaskRestoreView, 
-    TaskBulkDeleteView, 
-    CategoryCreateView, 
-    CategoryListView, 
-    CategoryDeleteView 
-)
-from tasks import views # 他のビュー（TaskDetailView, CategoryUpdateView, UserUpdateViewなど）はviewsから直接参照
+# tasksアプリケーションから必要なビューとURLパターンをインポート
+from tasks import views # 個別に参照するビュー（TaskListView, UserUpdateViewなど）はviewsから直接参照
+from tasks.urls import task_patterns, category_patterns
 
 # ==============================================================================
 # URL Patterns
@@ -38,86 +30,77 @@ urlpatterns = [
     # --------------------------------------------------
     
     # ホームページ (タスク一覧表示)
-    path('', TaskListView.as_view(), name='home'), 
+    path('', views.TaskListView.as_view(), name='home'), 
     
+    # 'tasks/' 配下のタスク関連URL (作成, 詳細, 編集, 削除, 完了, ゴミ箱, 復元, 一括削除)
+    path('tasks/', include(task_patterns)),
+
     # タスクのステータス更新
+    # 📝 Note: 既存のURL ('task/...') を維持するため、'tasks/' の include には含めない
     path('task/update_status/<int:pk>/', views.TaskUpdateStatusView.as_view(), name='task_update_status'),
 
-    # タスク作成ページ
-    path('tasks/create/', TaskCreateView.as_view(), name='task_create'),
-
-    # タスク詳細ビュー
-    path('tasks/<int:pk>/details/', views.TaskDetailView.as_view(), name='task_detail'), 
-
-    # タスク編集ページ
-    path('tasks/<int:pk>/edit/', TaskUpdateView.as_view(), name='task_update'), 
-    
-    # タスク削除処理
-    path('tasks/<int:pk>/delete/', TaskDeleteView.as_view(), name='task_delete'), 
-    
-    # ゴミ箱一覧
-    path('tasks/trash/', TrashView.as_view(), name='trash'), 
-    
-    # タスク復元処理
-    path('tasks/<int:pk>/restore/', TaskRestoreView.as_view(), name='task_restore'), 
-
-    # タスクの一括物理削除処理
-    path('tasks/bulk-delete/', TaskBulkDeleteView.as_view(), name='task_bulk_delete'),
-
     # --------------------------------------------------
     # カテゴリ機能 (Category Management URLs)
     # --------------------------------------------------
     
-    # カテゴリ一覧ページ
-    path('categories/', CategoryListView.as_view(), name='category_list'),
-    
-    # カテゴリ作成ページ
-    path('categories/create/', CategoryCreateView.as_view(), name='category_create'),
+    # 'categories/' 配下のカテゴリ関連URL (一覧, 作成, 削除)
+    path('categories/', include(category_patterns)),
     
     # カテゴリ編集ページ
+    # 📝 Note: 既存のURL ('category/...') を維持するため、'categories/' の include には含めない
     path('category/update/<int:pk>/', views.CategoryUpdateView.as_view(), name='category_update'),
-    
-    # カテゴリ削除処理
-    path('categories/delete/<int:pk>/', CategoryDeleteView.as_view(), name='category_delete'),
 
     # --------------------------------------------------
     # 認証・ユーザーアカウント機能 (Authentication & Account URLs)
     # --------------------------------------------------
     
-    # 💡 修正箇所：自作のログアウトビューを一番上に配置（GETリクエスト対応）
-    # path内の 'accounts/logout/' を指定することで標準のincludeよりも先にマッチさせます
-    path('accounts/logout/', views.logout_view, name='logout'),
+    # 'accounts/' 配下を1つの include にまとめ、URL名 (name) が重複しないように各ビューを明示的に定義する。
+    # 📝 Note: django.contrib.auth.urls をそのまま include すると logout, password_change などの
+    #          URL名が自作ビューと二重に登録されるため、必要なビューのみをここで個別に指定している。
+    path('accounts/', include([
+        # ログインページ
+        path('login/', auth_views.LoginView.as_view(), name='login'),
 
-    # Django標準の認証URLをインクルード (login, password_reset, etc.)
-    path('accounts/', include('django.contrib.auth.urls')),
-    
-    # ユーザー登録ページ
-    path('accounts/register/', UserRegisterView.as_view(), name='register'),
-    
-    # 登録完了画面
-    path('accounts/register/success/', 
-            TemplateView.as_view(template_name='registration/registration_success.html'), 
-            name='registration_success'),
+        # 自作のログアウトビュー（GETリクエスト対応）
+        path('logout/', views.logout_view, name='logout'),
 
-    # ユーザープロフィール（アカウント情報）編集ページ
-    path('accounts/profile/edit/', views.UserUpdateView.as_view(), name='profile_edit'),
-    
-    # パスワード変更フォーム
-    path('accounts/password_change/', 
-              auth_views.PasswordChangeView.as_view(
-                  template_name='registration/password_change_form.html',
-                  success_url=reverse_lazy('password_change_done') 
-              ), 
-              name='password_change'),
-    
-    # パスワード変更完了画面
-    path('accounts/password_change/done/', 
-              auth_views.PasswordChangeDoneView.as_view(
-                  template_name='registration/password_change_done.html'
-              ), 
-              name='password_change_done'),
-
-    # タスク完了切り替え処理
-    path('tasks/<int:pk>/complete/', views.task_complete, name='task_complete'),
+        # ユーザー登録ページ
+        path('register/', views.UserRegisterView.as_view(), name='register'),
+
+        # 登録完了画面
+        # 内容が固定の画面のため、ブラウザに1日キャッシュさせる (Cache-Control: private, max-age)
+        # 📝 Note: ナビゲーションにユーザー名やログアウトフォーム (CSRFトークン) が含まれるため、
+        #          private を指定して共有キャッシュ (プロキシ/CDN) には保存させない
+        path('register/success/', 
+                cache_control(private=True, max_age=60 * 60 * 24)(
+                    TemplateView.as_view(template_name='registration/registration_success.html')
+                ), 
+                name='registration_success'),
+
+        # ユーザープロフィール（アカウント情報）編集ページ
+        path('profile/edit/', views.UserUpdateView.as_view(), name='profile_edit'),
+
+        # パスワード変更フォーム (ブラウザやプロキシにキャッシュさせない)
+        path('password_change/', 
+                  never_cache(auth_views.PasswordChangeView.as_view(
+                      template_name='registration/password_change_form.html',
+                      # 完了画面のURLは逆引きで求める (スクリプトプレフィックス配下に配置した場合も正しいURLになる)
+                      success_url=reverse_lazy('password_change_done')
+                  )), 
+                  name='password_change'),
+
+        # パスワード変更完了画面 (ログインユーザー固有の画面のため、キャッシュさせない)
+        path('password_change/done/', 
+                  never_cache(auth_views.PasswordChangeDoneView.as_view(
+                      template_name='registration/password_change_done.html'
+                  )), 
+                  name='password_change_done'),
+
+        # パスワードリセット (Django標準の認証ビューをそのまま使用)
+        path('password_reset/', auth_views.PasswordResetView.as_view(), name='password_reset'),
+        path('password_reset/done/', auth_views.PasswordResetDoneView.as_view(), name='password_reset_done'),
+        path('reset/<uidb64>/<token>/', auth_views.PasswordResetConfirmView.as_view(), name='password_reset_confirm'),
+        path('reset/done/', auth_views.PasswordResetCompleteView.as_view(), name='password_reset_complete'),
+    ])),
 
 ]
\ No newline at end of file
@@ -0,0 +1,39 @@
+# tasks/backends.py
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+
+# ユーザーモデルを取得する（カスタムユーザーモデルに将来変更されても対応可能）
+User = get_user_model()
+
+
+# ==============================================================================
+# 認証バックエンド (Authentication Backends)
+# ==============================================================================
+class DeferredFieldsModelBackend(ModelBackend):
+    """
+    Django標準の ModelBackend を継承した認証バックエンド。
+    リクエストごとのログインユーザー取得 (request.user) で、画面上で使用しないフィールドを読み込まない。
+    """
+    # request.user の取得時に読み込まないフィールド（管理画面のユーザー編集以外では参照されない）
+    deferred_fields = ('date_joined', 'last_login')
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """
+        ModelBackend と同じ認証を行う。
+        認証に失敗した場合は PermissionDenied で後続のバックエンドへの問い合わせを打ち切り、
+        既存セッション用に残している ModelBackend が同じパスワード照合 (ハッシュ計算) を繰り返さないようにする。
+        """
+        user = super().authenticate(request, username=username, password=password, **kwargs)
+        if user is None:
+            raise PermissionDenied
+        return user
+
+    def get_user(self, user_id):
+        """セッションに保存されたユーザーIDから、不要なフィールドを除いてユーザーを取得する。"""
+        try:
+            user = User._default_manager.defer(*self.deferred_fields).get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
\ No newline at end of file
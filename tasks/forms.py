@@ -1,6 +1,6 @@
 # tasks/forms.py
 
-from django.contrib.auth.forms import UserCreationForm, UserChangeForm
+from django.contrib.auth.forms import UserCreationForm, UsernameField
 from django.contrib.auth.models import User
 from django import forms 
 from .models import Task, Category 
@@ -25,37 +25,71 @@ class UserRegisterForm(UserCreationForm):
         fields = ('username', 'email')
 
 # ユーザープロフィール編集用フォーム
-class UserProfileEditForm(UserChangeForm):
+class UserProfileEditForm(forms.ModelForm):
     """
     ログインユーザー自身のプロフィール情報（ユーザー名、メール、氏名など）を編集するためのフォーム。
-    セキュリティ上の理由から、パスワード関連フィールドは除外する。
+    管理用のフィールドやパスワード関連フィールドを生成しないよう、UserChangeFormではなくModelFormを継承する。
     """
-    # UserChangeFormに含まれるパスワードフィールドを意図的に無効化
-    password = None 
-    
     class Meta:
         model = User
         # ユーザーに編集させたいフィールドを指定（必要に応じて調整）
         fields = ('username', 'email', 'last_name', 'first_name')
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # 不要なDjango標準のフィールド（管理用データ）をフォームから削除
-        for field_name in ['date_joined', 'last_login', 'is_superuser', 'groups', 'user_permissions', 'is_staff', 'is_active']:
-            if field_name in self.fields:
-                del self.fields[field_name]
+        # ユーザー名の正規化（UserChangeFormと同じ UsernameField）を維持する
+        field_classes = {'username': UsernameField}
 
 # ==============================================================================
 # 2. タスク関連フォーム (Task Forms)
 # ==============================================================================
 
+# カテゴリ選択用フィールド
+class CategoryChoiceField(forms.ModelChoiceField):
+    """
+    一度だけ取得したカテゴリ一覧から、選択肢の表示と入力値の検証を行うフィールド。
+    ModelChoiceField は描画時と検証時にそれぞれクエリを発行するため、その重複を避ける。
+    """
+    # set_categories() で設定される取得済みのカテゴリ一覧 (未設定の場合は通常の ModelChoiceField と同じ動作)
+    categories = None
+
+    def set_categories(self, categories):
+        """カテゴリ一覧を評価して保持し、ドロップダウンの選択肢に反映する。"""
+        self.categories = list(categories)
+        choices = [(category.pk, str(category)) for category in self.categories]
+        if self.empty_label is not None:
+            choices.insert(0, ('', self.empty_label))
+        self.choices = choices
+
+    def to_python(self, value):
+        """入力値 (カテゴリID) を、取得済みの一覧から該当するカテゴリに変換する。"""
+        if self.categories is None or value in self.empty_values:
+            return super().to_python(value)
+        pk = str(getattr(value, 'pk', value))
+        for category in self.categories:
+            if str(category.pk) == pk:
+                return category
+        raise forms.ValidationError(
+            self.error_messages['invalid_choice'],
+            code='invalid_choice',
+            params={'value': value},
+        )
+
+
 # タスク作成・編集用フォーム
 class TaskForm(forms.ModelForm):
     """
     Taskモデルに基づいたフォーム。
     ログインユーザーが所有するカテゴリのみを選択肢として表示するロジックを含む。
     """
-    
+
+    # カテゴリ選択フィールド
+    # 未選択時のラベルやウィジェットはクラス定義時に一度だけ設定し、__init__ では選択肢の絞り込みのみ行う
+    category = CategoryChoiceField(
+        queryset=Category.objects.none(),
+        required=False,
+        empty_label='なし', # カテゴリが未選択の場合のラベル
+        label='カテゴリ',
+        widget=forms.Select(attrs={'class': 'form-select'}),
+    )
+
     def __init__(self, *args, **kwargs):
         # Viewから渡されるリクエストユーザー（'user'）をキーワード引数から取得
         user = kwargs.pop('user', None) 
@@ -67,26 +101,20 @@ class TaskForm(forms.ModelForm):
             category_field = self.fields['category']
             # ログインユーザーが作成したカテゴリのみをドロップダウンの選択肢として設定
             category_field.queryset = Category.objects.filter(user=user).order_by('name')
-            # カテゴリが未選択の場合のラベルを 'なし' に変更
-            category_field.empty_label = 'なし'
-            
-        # priorityフィールドにCSSクラスを適用（ModelMetaのwidgetsで設定されていない場合に対応）
-        if 'priority' in self.fields:
-            self.fields['priority'].widget.attrs.update({'class': 'form-select form-select-sm'})
-
-    # 💡 Note: __init__ メソッドがコードに二重定義されていたため、上記で統合しました。
+            # カテゴリ一覧を一度だけ取得し、選択肢の表示と入力値の検証の両方で使い回す
+            category_field.set_categories(category_field.queryset)
     
     class Meta:
         model = Task
         # フォームに表示するフィールドの順序とリストを定義
         fields = ['title', 'description', 'due_date', 'status', 'category', 'priority']
 
+        # 📝 Note: category はクラス属性で定義しているため、ラベルとウィジェットはそちらで指定する
         labels = {
             'title': 'タイトル',
             'description': '詳細',
             'due_date': '期限',
             'status': '進捗状況',
-            'category': 'カテゴリ',
             'priority': '優先度',
         }
         
@@ -99,8 +127,7 @@ class TaskForm(forms.ModelForm):
             
             # ドロップダウン/セレクトボックスにBootstrapのクラスを適用
             'status': forms.Select(attrs={'class': 'form-select form-select-sm'}),
-            'category': forms.Select(attrs={'class': 'form-select'}), 
-            # priority は __init__ でクラス適用をチェックする
+            'priority': forms.Select(attrs={'class': 'form-select form-select-sm'}),
         }
 
 # ==============================================================================
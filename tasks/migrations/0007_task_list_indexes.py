@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-15 09:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    このマイグレーションは、Taskモデルに一覧画面用の複合インデックスを追加します。
+    タスク一覧・ゴミ箱の絞り込み (user, is_deleted) と並び替え (due_date / deleted_at) に対応します。
+    """
+
+    # このマイグレーションが依存するマイグレーションを指定
+    dependencies = [
+        # 0006 の後に実行される
+        ('tasks', '0006_alter_task_priority'),
+        # ユーザーモデルに依存
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # データベースに対して実行される操作のリスト
+    operations = [
+        # 1. タスク一覧用のインデックス (user, is_deleted, due_date)
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_deleted', 'due_date'], name='tasks_task_user_id_c11cf2_idx'),
+        ),
+        # 2. ゴミ箱用のインデックス (user, is_deleted, deleted_at)
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_deleted', 'deleted_at'], name='tasks_task_user_id_ea2c4f_idx'),
+        ),
+    ]
\ No newline at end of file
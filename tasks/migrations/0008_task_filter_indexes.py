@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-15 09:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    このマイグレーションは、Taskモデルにタスク一覧の絞り込み用の複合インデックスを追加します。
+    タスク一覧の絞り込み (user, is_deleted) と、進捗状況 (status) / 優先度 (priority) に対応します。
+    """
+
+    # このマイグレーションが依存するマイグレーションを指定
+    dependencies = [
+        # 0007 の後に実行される
+        ('tasks', '0007_task_list_indexes'),
+        # ユーザーモデルに依存
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # データベースに対して実行される操作のリスト
+    operations = [
+        # 1. 進捗状況用のインデックス (user, is_deleted, status)
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_deleted', 'status'], name='tasks_task_user_id_765aaf_idx'),
+        ),
+        # 2. 優先度用のインデックス (user, is_deleted, priority)
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_deleted', 'priority'], name='tasks_task_user_id_01f978_idx'),
+        ),
+    ]
\ No newline at end of file
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+
+# 📝 Note: タスク一覧の検索は title / description の icontains (部分一致) で行っている。
+# PostgreSQL では UPPER("列"::text) LIKE UPPER('%キーワード%') に変換されるため、
+# 同じ式に対する pg_trgm の GIN インデックスを作成すると、先頭が % の LIKE でもインデックスを利用できる。
+# (SearchVector による全文検索は日本語を単語に分割できないため採用していない)
+TRIGRAM_INDEXES = (
+    ('tasks_task_title_upper_trgm_idx', 'title'),
+    ('tasks_task_description_upper_trgm_idx', 'description'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """PostgreSQL の場合のみ、pg_trgm 拡張と検索用の GIN インデックスを作成する。"""
+    # SQLite (開発環境) には pg_trgm がないため、何もしない
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "tasks_task" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """create_trigram_indexes の逆操作 (拡張は他で使われている可能性があるため残す)。"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+    """
+    このマイグレーションは、タスク検索 (タイトル・詳細の部分一致) 用のトライグラムインデックスを追加します。
+    PostgreSQL (本番環境) でのみ作成され、SQLite では何も行いません。
+    """
+
+    # このマイグレーションが依存するマイグレーションを指定
+    dependencies = [
+        # 0008 の後に実行される
+        ('tasks', '0008_task_filter_indexes'),
+    ]
+
+    # データベースに対して実行される操作のリスト
+    operations = [
+        # 1. 検索用の GIN (gin_trgm_ops) インデックスの作成 / 削除
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
\ No newline at end of file
@@ -119,6 +119,18 @@ class Task(models.Model):
         # 1. 'due_date' (期限が近い順に並ぶ)
         # 2. '-created_at' (期限が同じ場合は新しいタスクが上に来る)
         ordering = ['due_date', '-created_at'] 
+
+        # 一覧画面の検索条件・並び順に合わせた複合インデックス
+        indexes = [
+            # タスク一覧 (TaskListView): user + is_deleted で絞り込み、due_date で並び替え
+            models.Index(fields=['user', 'is_deleted', 'due_date']),
+            # ゴミ箱 (TrashView): user + is_deleted で絞り込み、deleted_at で並び替え
+            models.Index(fields=['user', 'is_deleted', 'deleted_at']),
+            # タスク一覧 (TaskListView): 進捗状況での絞り込み・並び替え
+            models.Index(fields=['user', 'is_deleted', 'status']),
+            # タスク一覧 (TaskListView): 優先度での絞り込み
+            models.Index(fields=['user', 'is_deleted', 'priority']),
+        ]
         
     def __str__(self):
         """オブジェクトの文字列表現としてタイトルを返す。"""
@@ -0,0 +1,50 @@
+# tasks/templatetags/task_urls.py
+
+from functools import lru_cache
+
+from django import template
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import get_script_prefix, get_urlconf, reverse
+
+register = template.Library()
+
+# URL逆引き時に pk の位置を特定するための仮の値（実際のタスクIDと衝突しない大きな値）
+_PK_PLACEHOLDER = str(2 ** 31 - 1)
+
+
+@lru_cache(maxsize=None)
+def _split_task_url(name, urlconf):
+    """
+    URL名に対応するパスを、pk の前後（prefix, suffix）に分割して返す。
+    reverse() はURL名とURL設定 (urlconf) の組み合わせごとに一度だけ実行され、以降はキャッシュされた結果を使用する。
+    📝 Note: スクリプトプレフィックス (FORCE_SCRIPT_NAME や ASGI の root_path) はリクエストごとに
+             設定されるため、キャッシュには含めず、先頭から取り除いた相対パスを保持する。
+    """
+    url = reverse(name, urlconf=urlconf, kwargs={'pk': _PK_PLACEHOLDER})
+    script_prefix = get_script_prefix()
+    if url.startswith(script_prefix):
+        url = url[len(script_prefix):]
+    prefix, _, suffix = url.rpartition(_PK_PLACEHOLDER)
+    return prefix, suffix
+
+
+@receiver(setting_changed)
+def _clear_task_url_cache(*, setting, **kwargs):
+    """ROOT_URLCONF が変更された場合 (テストの override_settings など)、キャッシュしたURLを破棄する。"""
+    # Django の clear_url_caches と同様に、URL設定の変更後は古い逆引き結果を使わない
+    if setting == 'ROOT_URLCONF':
+        _split_task_url.cache_clear()
+
+
+@register.simple_tag
+def task_url(name, pk):
+    """
+    {% url name pk %} と同じURLを返すテンプレートタグ。
+    一覧画面のように行ごとにURLを生成する箇所で、毎回の reverse() 呼び出しを避けるために使用する。
+    例: {% task_url 'task_update' task.pk %}
+    """
+    # リクエストごとのURL設定 (request.urlconf) が指定されている場合は、それをキャッシュのキーに含める
+    prefix, suffix = _split_task_url(name, get_urlconf())
+    # 現在のリクエストのスクリプトプレフィックスを付けて返す
+    return f'{get_script_prefix()}{prefix}{pk}{suffix}'
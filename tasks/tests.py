@@ -2,12 +2,16 @@
 tasksアプリケーションのモデル、ビュー、認証に関するテストスイート。
 BaseTestクラスで共通のテストデータをセットアップし、各テストクラスで機能を検証する。
 """
-from django.test import TestCase, Client
-from django.urls import reverse
+from django.test import SimpleTestCase, TestCase, Client, override_settings
+from django.urls import URLResolver, get_resolver, get_script_prefix, path, reverse, set_script_prefix, set_urlconf
+from django.urls.resolvers import RoutePattern
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 import datetime
+import types
 
+from .backends import DeferredFieldsModelBackend
+from .templatetags.task_urls import task_url
 from .models import Task, Category
 
 # 認証済みユーザーが必要なビューをテストするために、Userモデルを取得
@@ -19,45 +23,55 @@ class BaseTest(TestCase):
     テストクラス間で共有される共通のセットアップを定義する基底クラス。
     認証ユーザー、カテゴリ、様々な状態のタスクなどの初期データを準備する (Arrange)。
     """
-    def setUp(self):
-        """テスト実行前の初期設定"""
-        self.client = Client()
+    @classmethod
+    def setUpTestData(cls):
+        """クラス単位で一度だけ作成する共通のテストデータ（各テスト後の変更はロールバックされる）"""
+        # 認証ユーザーの作成
+        cls.user = User.objects.create_user(username='testuser', password='password')
         
-        # 認証ユーザーの作成とログイン処理
-        self.user = User.objects.create_user(username='testuser', password='password')
-        self.client.login(username='testuser', password='password')
+        # カテゴリの作成 (1回の INSERT でまとめて作成)
+        cls.category_work, cls.category_private = Category.objects.bulk_create([
+            Category(name='仕事', user=cls.user),
+            Category(name='プライベート', user=cls.user),
+        ])
         
-        # カテゴリの作成
-        self.category_work = Category.objects.create(name='仕事', user=self.user)
-        self.category_private = Category.objects.create(name='プライベート', user=self.user)
+        # テスト用タスクの作成 (1回の INSERT でまとめて作成)
+        cls.task_active, cls.task_completed, cls.task_deleted = Task.objects.bulk_create([
+            # 未着手, 未削除
+            Task(
+                user=cls.user,
+                title='アクティブなタスク',
+                category=cls.category_work,
+                priority='high',
+                due_date=timezone.now() + datetime.timedelta(days=5),
+                status=0,         # status=0 は未着手
+            ),
+            # 完了済み, 未削除
+            Task(
+                user=cls.user,
+                title='完了したタスク',
+                category=cls.category_work,
+                priority='medium',
+                status=2,         # status=2 は完了
+            ),
+            # 削除済み/ゴミ箱
+            Task(
+                user=cls.user,
+                title='削除されたタスク',
+                category=cls.category_private,
+                priority='low',
+                status=0,
+                is_deleted=True,  # 論理削除フラグを設定
+                deleted_at=timezone.now() # 削除日時を設定
+            ),
+        ])
+
+    def setUp(self):
+        """テスト実行前の初期設定（クライアントの状態はテストごとに独立させる）"""
+        self.client = Client()
         
-        # テスト用タスクの作成 (未着手, 未削除)
-        self.task_active = Task.objects.create(
-            user=self.user,
-            title='アクティブなタスク',
-            category=self.category_work,
-            priority='high',
-            due_date=timezone.now() + datetime.timedelta(days=5),
-            status=0,         # status=0 は未着手
-        )
-        # テスト用タスクの作成 (完了済み, 未削除)
-        self.task_completed = Task.objects.create(
-            user=self.user,
-            title='完了したタスク',
-            category=self.category_work,
-            priority='medium',
-            status=2,         # status=2 は完了
-        )
-        # テスト用タスクの作成 (削除済み/ゴミ箱)
-        self.task_deleted = Task.objects.create(
-            user=self.user,
-            title='削除されたタスク',
-            category=self.category_private,
-            priority='low',
-            status=0,
-            is_deleted=True,  # 論理削除フラグを設定
-            deleted_at=timezone.now() # 削除日時を設定
-        )
+        # ログイン処理 (認証処理・パスワード照合を省略し、セッションを直接設定する)
+        self.client.force_login(self.user)
 
 
 class TaskModelTest(BaseTest):
@@ -92,8 +106,9 @@ class TaskViewTest(BaseTest):
 
     def test_home_view_status_code_and_content(self):
         """タスク一覧 (home) へのアクセスが成功し、未削除のタスクのみが表示されるか"""
-        # Act: homeビューにアクセス
-        response = self.client.get(reverse('home'))
+        # Act: homeビューにアクセス (セッション, ユーザー, 件数(ページ送り), タスク一覧, カテゴリ一覧 の5クエリ)
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('home'))
         # Assert: ステータスコードと使用テンプレートを確認
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'tasks/home.html')
@@ -103,6 +118,86 @@ class TaskViewTest(BaseTest):
         self.assertContains(response, '完了したタスク')
         # Assert: 削除されたタスクは表示されないことを確認
         self.assertNotContains(response, '削除されたタスク')
+        # Assert: 行ごとのリンク (task_url タグ) が reverse() と同じURLを出力していることを確認
+        for name in ('task_detail', 'task_update_status', 'task_update', 'task_delete'):
+            self.assertContains(response, reverse(name, args=[self.task_active.pk]))
+
+    def test_home_view_query_count_does_not_grow_with_tasks(self):
+        """タスク数が増えても、一覧表示のクエリ数がタスクごとに増えない (N+1にならない) か"""
+        # Arrange: カテゴリ付きのタスクを追加で作成
+        for i in range(5):
+            Task.objects.create(user=self.user, title=f'追加タスク{i}', category=self.category_private)
+
+        # Act & Assert: セッション, ユーザー, 件数(ページ送り), タスク一覧(カテゴリJOIN), カテゴリ一覧 の5クエリで済むことを確認
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('home'))
+        self.assertContains(response, '追加タスク4')
+
+    def test_home_view_category_filter_reuses_category_list(self):
+        """カテゴリで絞り込んだ場合も、選択中カテゴリの取得に追加のクエリを発行しないか"""
+        # Act: カテゴリで絞り込んだ一覧にアクセス (カテゴリフィルタなしと同じ5クエリ)
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('home'), {'category': self.category_work.pk})
+
+        # Assert: 選択中カテゴリがカテゴリ一覧から特定されていることを確認
+        self.assertEqual(response.context['selected_category'], self.category_work)
+
+    def test_home_view_ignores_non_decimal_filters(self):
+        """数値として扱えないカテゴリ・進捗状況の指定は無視され、サーバーエラーにならないか"""
+        # Act: isdigit() は True になるが int() に変換できない値で絞り込む
+        response = self.client.get(reverse('home'), {'category': '²', 'status': '²'})
+
+        # Assert: 絞り込みは適用されず、一覧が表示されることを確認
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'アクティブなタスク')
+
+    def test_home_view_is_paginated(self):
+        """タスク一覧が1ページあたり paginate_by 件に制限され、ページ送りリンクが絞り込み条件を保持するか"""
+        # Arrange: 1ページ (50件) を超えるタスクを作成 (既存の2件と合わせて52件)
+        Task.objects.bulk_create(
+            Task(user=self.user, title=f'追加タスク{i}', priority='high') for i in range(50)
+        )
+
+        # Act: 優先度で絞り込んだ1ページ目にアクセス
+        response = self.client.get(reverse('home'), {'priority': 'high'})
+
+        # Assert: 1ページ目は50件で、次のページへのリンクが絞り込み条件を保持していることを確認
+        self.assertEqual(len(response.context['tasks']), 50)
+        self.assertTrue(response.context['page_obj'].has_next())
+        self.assertContains(response, '?priority=high&amp;page=2')
+
+        # Act & Assert: 2ページ目には残りの1件が表示される
+        response = self.client.get(reverse('home'), {'priority': 'high', 'page': 2})
+        self.assertEqual(len(response.context['tasks']), 1)
+
+    def test_home_view_out_of_range_page_falls_back_to_last_page(self):
+        """ステータス変更で最後のページが空になっても、page 付きのリダイレクト先が 404 にならないか"""
+        # Arrange: 未着手のタスクを追加し、未着手の絞り込みで2ページ (50件 + 1件) にする
+        Task.objects.bulk_create(
+            Task(user=self.user, title=f'追加タスク{i}', status=0) for i in range(50)
+        )
+
+        # Act: 2ページ目を表示した状態で、1件を進行中に変更する (2ページ目が空になる)
+        response = self.client.post(
+            reverse('task_update_status', args=[self.task_active.pk]),
+            {'new_status': 1, 'filter_params': 'status=0&page=2'},
+            follow=True,
+        )
+
+        # Assert: 404 にならず、最後の有効なページ (1ページ目) が表示されることを確認
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['page_obj'].number, 1)
+        self.assertEqual(len(response.context['tasks']), 50)
+
+    def test_home_view_due_date_sort_places_null_due_dates(self):
+        """期限による並び替えで、期限なしのタスクが昇順では最後、降順では最初に並ぶか"""
+        # Act & Assert: デフォルト (期限の昇順) では、期限なしの task_completed が最後
+        response = self.client.get(reverse('home'))
+        self.assertEqual(list(response.context['tasks']), [self.task_active, self.task_completed])
+
+        # Act & Assert: 期限の降順では、期限なしの task_completed が最初
+        response = self.client.get(reverse('home'), {'sort': 'due_date', 'order': 'desc'})
+        self.assertEqual(list(response.context['tasks']), [self.task_completed, self.task_active])
 
     def test_task_create_and_redirect(self):
         """タスクの新規作成とリダイレクトのテスト"""
@@ -123,6 +218,25 @@ class TaskViewTest(BaseTest):
         # Assert: データベースにタスクが作成されたことを確認
         self.assertTrue(Task.objects.filter(title='新規タスクのテスト').exists())
 
+    def test_task_create_rejects_other_users_category(self):
+        """他のユーザーのカテゴリを指定した場合、バリデーションエラーになるか"""
+        # Arrange: 別ユーザーのカテゴリを作成
+        other_user = User.objects.create_user(username='otheruser', password='password')
+        other_category = Category.objects.create(name='他人のカテゴリ', user=other_user)
+
+        # Act: 別ユーザーのカテゴリを指定してタスク作成をPOST
+        response = self.client.post(reverse('task_create'), data={
+            'title': '不正なカテゴリのタスク',
+            'category': other_category.pk,
+            'priority': 'none',
+            'status': 0,
+        })
+
+        # Assert: フォームが再表示され、タスクが作成されていないことを確認
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('category', response.context['form'].errors)
+        self.assertFalse(Task.objects.filter(title='不正なカテゴリのタスク').exists())
+
     def test_task_complete(self):
         """タスク完了処理のテスト (論理完了)"""
         # Arrange: 完了前の状態が未着手(0)であることを確認
@@ -137,6 +251,55 @@ class TaskViewTest(BaseTest):
         self.task_active.refresh_from_db()
         self.assertEqual(self.task_active.status, 2)
 
+    def test_task_complete_already_completed(self):
+        """完了済みタスクの完了処理は、行を更新せずにリダイレクトされるか"""
+        # Arrange: 完了済みタスクの更新日時を記録
+        updated_at = self.task_completed.updated_at
+
+        # Act: 完了済みタスクに対して完了処理ビューにPOSTリクエストを送信
+        response = self.client.post(reverse('task_complete', args=[self.task_completed.pk]))
+        # Assert: 404 にならず、homeビューにリダイレクトされたことを確認
+        self.assertRedirects(response, reverse('home'))
+
+        # Assert: 行が書き換えられていない (更新日時が変わっていない) ことを確認
+        self.task_completed.refresh_from_db()
+        self.assertEqual(self.task_completed.status, 2)
+        self.assertEqual(self.task_completed.updated_at, updated_at)
+
+        # Assert: 存在しないタスクの場合は 404 を返すことを確認
+        response = self.client.post(reverse('task_complete', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_task_complete_get_does_not_update(self):
+        """GETでの完了処理はステータスを変更せずにリダイレクトし、存在しないタスクは 404 になるか"""
+        # Act & Assert: 自分のタスクへのGETは、更新せずにhomeへリダイレクト
+        response = self.client.get(reverse('task_complete', args=[self.task_active.pk]))
+        self.assertRedirects(response, reverse('home'))
+        self.task_active.refresh_from_db()
+        self.assertEqual(self.task_active.status, 0)
+
+        # Act & Assert: 存在しないタスクへのGETは 404
+        response = self.client.get(reverse('task_complete', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_task_update_status(self):
+        """一覧画面からのステータス更新 (インライン更新) のテスト"""
+        # Act: ステータス更新ビューに新しいステータス (1: 進行中) をPOST
+        response = self.client.post(
+            reverse('task_update_status', args=[self.task_active.pk]),
+            {'new_status': 1, 'filter_params': 'status=1'},
+        )
+        # Assert: 元のフィルタ付きで homeビューにリダイレクトされたことを確認
+        self.assertRedirects(response, f"{reverse('home')}?status=1")
+
+        # Assert: データベースのステータスが 1 (進行中) になっているか確認
+        self.task_active.refresh_from_db()
+        self.assertEqual(self.task_active.status, 1)
+
+        # Assert: 存在しないタスクの場合は 404 を返すことを確認
+        response = self.client.post(reverse('task_update_status', args=[0]), {'new_status': 1})
+        self.assertEqual(response.status_code, 404)
+
     def test_task_delete_soft(self):
         """タスク削除処理のテスト (論理削除)"""
         # Arrange: 削除前はis_deletedがFalseであることを確認
@@ -152,14 +315,19 @@ class TaskViewTest(BaseTest):
         self.assertTrue(self.task_active.is_deleted)
         self.assertIsNotNone(self.task_active.deleted_at)
 
+        # Assert: 存在しないタスクの場合は 404 を返すことを確認
+        response = self.client.post(reverse('task_delete', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
 
 class CategoryViewTest(BaseTest):
     """カテゴリ関連ビュー（一覧, 作成, 編集, 削除）の動作テスト"""
     
     def test_category_list_view(self):
         """カテゴリ一覧ページへのアクセスと内容の確認"""
-        # Act: カテゴリ一覧ビューにアクセス
-        response = self.client.get(reverse('category_list'))
+        # Act: カテゴリ一覧ビューにアクセス (セッション, ユーザー, タスク数付きカテゴリ一覧 の3クエリ)
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('category_list'))
         # Assert: ステータスコードと使用テンプレートを確認
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'tasks/category_list.html')
@@ -168,6 +336,22 @@ class CategoryViewTest(BaseTest):
         # HTMLの厳密なタグ構造に依存せず、タスク数が含まれていることをチェック
         self.assertContains(response, '2')
         self.assertContains(response, '1')
+
+    def test_category_list_query_count_does_not_grow_with_categories(self):
+        """カテゴリ数が増えても、一覧表示のクエリ数がカテゴリごとに増えない (N+1にならない) か"""
+        # Arrange: タスク付きのカテゴリを追加で作成
+        categories = Category.objects.bulk_create(
+            Category(name=f'追加カテゴリ{i}', user=self.user) for i in range(5)
+        )
+        Task.objects.bulk_create(
+            Task(user=self.user, title=f'追加タスク{i}', category=category)
+            for i, category in enumerate(categories)
+        )
+
+        # Act & Assert: カテゴリが7件になっても、セッション, ユーザー, タスク数付きカテゴリ一覧 の3クエリで済むことを確認
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('category_list'))
+        self.assertContains(response, '追加カテゴリ4')
         
     def test_category_create(self):
         """カテゴリ新規作成のテスト"""
@@ -211,8 +395,9 @@ class TrashViewTest(BaseTest):
     
     def test_trash_view_content(self):
         """ゴミ箱ページに削除済みタスクのみが表示されるか"""
-        # Act: ゴミ箱ビューにアクセス
-        response = self.client.get(reverse('trash'))
+        # Act: ゴミ箱ビューにアクセス (セッション, ユーザー, 件数(ページ送り), 削除済みタスク一覧 の4クエリ)
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('trash'))
         # Assert: ステータスコードを確認
         self.assertEqual(response.status_code, 200)
         
@@ -240,22 +425,175 @@ class TrashViewTest(BaseTest):
         """タスク完全削除 (パージ) 処理のテスト"""
         
         # Act: 削除済みタスクのPKを渡して一括削除 (物理削除) を実行
-        response = self.client.post(reverse('task_bulk_delete'), {'task_ids': [self.task_deleted.pk]})
+        # (セッション, ユーザー, DELETE の3クエリ。削除前に対象行を SELECT しないことを確認)
+        with self.assertNumQueries(3):
+            response = self.client.post(reverse('task_bulk_delete'), {'task_ids': [self.task_deleted.pk]})
         # Assert: ゴミ箱 (trash) にリダイレクトされたことを確認
         self.assertRedirects(response, reverse('trash'))
         
         # Assert: タスクがデータベースから完全に削除されたことを確認
         self.assertFalse(Task.objects.filter(pk=self.task_deleted.pk).exists())
 
+    def test_task_bulk_delete_ignores_invalid_ids(self):
+        """数値でないタスクIDは無視され、ゴミ箱全体が削除されないことを確認"""
+        # Act: 不正なIDのみを渡して一括削除を実行
+        # ('²' は isdigit() が True になるが int() に変換できない。'9' * 30 は主キーの範囲を超える)
+        response = self.client.post(reverse('task_bulk_delete'), {'task_ids': ['abc', '²', '9' * 30, '0']})
+        # Assert: ゴミ箱 (trash) にリダイレクトされ、削除済みタスクは残っていることを確認
+        self.assertRedirects(response, reverse('trash'))
+        self.assertTrue(Task.objects.filter(pk=self.task_deleted.pk).exists())
+
+
+class URLConfTest(SimpleTestCase):
+    """URL設定 (config/urls.py, tasks/urls.py) に関するテスト"""
+
+    def test_project_urls_use_path_only(self):
+        """管理画面以外のURLがすべて path() で定義され、正規表現 (re_path) を使用していないか"""
+        def iter_patterns(patterns):
+            for pattern in patterns:
+                # 管理画面 (admin.site.urls) は Django 側の定義のため対象外
+                if isinstance(pattern, URLResolver) and pattern.app_name == 'admin':
+                    continue
+                yield pattern
+                if isinstance(pattern, URLResolver):
+                    yield from iter_patterns(pattern.url_patterns)
+
+        for pattern in iter_patterns(get_resolver().url_patterns):
+            with self.subTest(pattern=str(pattern.pattern)):
+                self.assertIsInstance(pattern.pattern, RoutePattern)
+
+    def test_task_url_follows_script_prefix(self):
+        """task_url タグが、キャッシュ後もリクエストごとのスクリプトプレフィックスを反映するか"""
+        original_prefix = get_script_prefix()
+        self.addCleanup(set_script_prefix, original_prefix)
+
+        # Arrange & Assert: プレフィックスなしで一度呼び出し、URLをキャッシュさせる
+        self.assertEqual(task_url('task_update', 5), reverse('task_update', args=[5]))
+
+        # Act & Assert: プレフィックスを変更しても reverse() と同じURLを返すことを確認
+        set_script_prefix('/app/')
+        self.assertEqual(task_url('task_update', 5), reverse('task_update', args=[5]))
+        self.assertTrue(task_url('task_update', 5).startswith('/app/'))
+
+    def test_task_url_follows_urlconf(self):
+        """task_url タグが、ROOT_URLCONF の変更やリクエストごとのURL設定を反映するか"""
+        # Arrange: task_update を別のパスに割り当てたURL設定
+        alt_urls = types.ModuleType('alt_urls')
+        alt_urls.urlpatterns = [
+            path('v2/tasks/<int:pk>/edit/', lambda request, pk: None, name='task_update'),
+        ]
+        # 既定のURL設定で一度呼び出し、URLをキャッシュさせる
+        self.assertEqual(task_url('task_update', 5), '/tasks/5/edit/')
+
+        # Act & Assert: ROOT_URLCONF を変更した場合
+        with override_settings(ROOT_URLCONF=alt_urls):
+            self.assertEqual(task_url('task_update', 5), '/v2/tasks/5/edit/')
+        self.assertEqual(task_url('task_update', 5), '/tasks/5/edit/')
+
+        # Act & Assert: リクエストごとのURL設定 (request.urlconf) を使用した場合
+        self.addCleanup(set_urlconf, None)
+        set_urlconf(alt_urls)
+        self.assertEqual(task_url('task_update', 5), '/v2/tasks/5/edit/')
+
+
+class CachedPageTest(TestCase):
+    """ブラウザにキャッシュさせる画面 (登録完了画面) とキャッシュさせない画面のテスト"""
+
+    def test_registration_success_is_cached_privately(self):
+        """登録完了画面が、共有キャッシュに保存されない private なキャッシュ指定で返されるか"""
+        # Arrange: ログイン済みのユーザー (ナビゲーションにユーザー名が表示される)
+        user = User.objects.create_user(username='cacheduser', password='password')
+        self.client.force_login(user)
+
+        # Act: 登録完了画面を表示
+        response = self.client.get(reverse('registration_success'))
+
+        # Assert: 本人の描画結果が、private かつ max-age 付きで返されることを確認
+        self.assertContains(response, 'cacheduser')
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('max-age=86400', response['Cache-Control'])
 
-class AuthenticationTest(TestCase):
-    """認証と権限のテスト（ログイン不要の基底クラスとは分離）"""
+        # Act & Assert: 未ログインのユーザーには、先に表示したユーザー名が含まれないことを確認
+        response = Client().get(reverse('registration_success'))
+        self.assertNotContains(response, 'cacheduser')
+
+    def test_password_change_is_never_cached(self):
+        """パスワード変更画面にキャッシュ無効化のヘッダーが付与されているか"""
+        user = User.objects.create_user(username='testuser', password='password')
+        self.client.force_login(user)
+        for url in (reverse('password_change'), reverse('password_change_done')):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertIn('no-store', response['Cache-Control'])
+
+
+class PasswordChangeTest(TestCase):
+    """パスワード変更画面のテスト"""
+
+    def test_password_change_redirects_under_script_prefix(self):
+        """パスワード変更後のリダイレクト先に、スクリプトプレフィックスが反映されるか"""
+        user = User.objects.create_user(username='testuser', password='old-password-123')
+        self.client.force_login(user)
+        self.addCleanup(set_script_prefix, get_script_prefix())
+
+        # Act: '/app/' 配下に配置された状態でパスワードを変更
+        # (テストクライアントはプレフィックスを除いたパスで呼び出すため、URLは先に逆引きしておく)
+        url = reverse('password_change')
+        set_script_prefix('/app/')
+        response = self.client.post(url, {
+            'old_password': 'old-password-123',
+            'new_password1': 'new-Password-456',
+            'new_password2': 'new-Password-456',
+        })
+
+        # Assert: 完了画面へのリダイレクト先がプレフィックス付きのURLであることを確認
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], '/app/accounts/password_change/done/')
+
+
+class AuthenticationBackendTest(TestCase):
+    """独自認証バックエンド (DeferredFieldsModelBackend) のテスト"""
+
+    def test_get_user_defers_unused_fields(self):
+        """get_user が管理用フィールドを読み込まずにユーザーを返すか"""
+        user = User.objects.create_user(username='testuser', password='password')
+        backend = DeferredFieldsModelBackend()
+
+        # Act: セッションのユーザーIDからユーザーを取得
+        fetched = backend.get_user(user.pk)
+
+        # Assert: 同じユーザーが返され、date_joined / last_login は読み込まれていないことを確認
+        self.assertEqual(fetched, user)
+        self.assertEqual(fetched.get_deferred_fields(), {'date_joined', 'last_login'})
+        # Assert: 存在しないユーザーIDの場合は None を返すことを確認
+        self.assertIsNone(backend.get_user(0))
+
+    def test_sessions_from_model_backend_stay_logged_in(self):
+        """導入前の ModelBackend で作成されたセッションが引き続き有効で、新しいログインは独自バックエンドを使うか"""
+        user = User.objects.create_user(username='testuser', password='password')
+
+        # Act & Assert: ModelBackend のパスを保存したセッションでも、ログイン状態で一覧を表示できる
+        self.client.force_login(user, backend='django.contrib.auth.backends.ModelBackend')
+        response = self.client.get(reverse('home'))
+        self.assertEqual(response.status_code, 200)
+
+        # Act & Assert: 新しいログインのセッションには独自バックエンドのパスが保存される
+        self.client.logout()
+        self.assertTrue(self.client.login(username='testuser', password='password'))
+        self.assertEqual(
+            self.client.session['_auth_user_backend'], 'tasks.backends.DeferredFieldsModelBackend'
+        )
+        # Assert: パスワードが誤っている場合はログインできない
+        self.client.logout()
+        self.assertFalse(self.client.login(username='testuser', password='wrong'))
+
+
+class AuthenticationTest(SimpleTestCase):
+    """
+    認証と権限のテスト（ログイン不要の基底クラスとは分離）
+    未ログイン時のリダイレクトのみを確認するため、データベースを使用しない SimpleTestCase を継承する。
+    """
     
-    def setUp(self):
-        """テスト実行前の初期設定（ログインしないユーザーを作成）"""
-        # ログイン処理を行わないため、Clientの作成は個別のテストメソッドで行う
-        self.user = User.objects.create_user(username='testuser', password='password')
-        
     def test_login_required(self):
         """ログインしていないユーザーは認証が必要なビューにリダイレクトされるかテスト"""
         client = Client()
@@ -267,9 +605,10 @@ class AuthenticationTest(TestCase):
             reverse('category_list'),
         ]
         
-        # Act & Assert: 各URLへのアクセスをテスト
+        # Act & Assert: 各URLへのアクセスをテスト (subTest で失敗したURLを個別に報告する)
         for url in protected_urls:
-            response = client.get(url)
-            self.assertEqual(response.status_code, 302) # リダイレクトステータスコード
-            # リダイレクト先がログインページであることを確認 (nextパラメータを含む)
-            self.assertRedirects(response, f'{reverse("login")}?next={url}')
\ No newline at end of file
+            with self.subTest(url=url):
+                response = client.get(url)
+                self.assertEqual(response.status_code, 302) # リダイレクトステータスコード
+                # リダイレクト先がログインページであることを確認 (nextパラメータを含む)
+                self.assertRedirects(response, f'{reverse("login")}?next={url}')
\ No newline at end of file
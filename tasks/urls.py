@@ -6,28 +6,46 @@ from . import views # tasksアプリのビュー（tasks/views.py）をインポ
 # ==============================================================================
 # URL Patterns (タスクアプリケーション固有のURL定義)
 # 📝 注意: これらのURLは、config/urls.py で include されるパスの続きとなる
+#          プレフィックスごとに include することで、一致しないURLではサブツリー全体の照合が省略される
 # ==============================================================================
 
-urlpatterns = [
-    # タスク一覧 (Home)
-    # 例: config/urls.py で path('', include('tasks.urls')) とあれば、このパスは '/' になる
-    path('', views.TaskListView.as_view(), name='home'), 
-    
-    # タスク作成
+# タスク関連のURL
+# 例: config/urls.py で path('tasks/', include(task_patterns)) とあれば、'create/' は '/tasks/create/' になる
+task_patterns = [
+    # タスク作成ページ
     path('create/', views.TaskCreateView.as_view(), name='task_create'),
+
+    # タスク詳細ビュー
+    path('<int:pk>/details/', views.TaskDetailView.as_view(), name='task_detail'), 
+
+    # タスク編集ページ
+    path('<int:pk>/edit/', views.TaskUpdateView.as_view(), name='task_update'), 
     
-    # タスク編集 (タスクID <pk> をURLパラメータとして受け取る)
-    path('<int:pk>/update/', views.TaskUpdateView.as_view(), name='task_update'),
-    
-    # タスク削除（ソフトデリートを実行。タスクID <pk> を受け取る）
-    path('<int:pk>/delete/', views.TaskDeleteView.as_view(), name='task_delete'),
+    # タスク削除処理（ソフトデリート）
+    path('<int:pk>/delete/', views.TaskDeleteView.as_view(), name='task_delete'), 
+
+    # タスク完了切り替え処理
+    path('<int:pk>/complete/', views.task_complete, name='task_complete'),
     
     # ゴミ箱一覧（論理削除されたタスクを表示）
-    path('trash/', views.TrashView.as_view(), name='trash'),
+    path('trash/', views.TrashView.as_view(), name='trash'), 
+    
+    # タスク復元処理
+    path('<int:pk>/restore/', views.TaskRestoreView.as_view(), name='task_restore'), 
+
+    # タスクの一括物理削除処理
+    path('bulk-delete/', views.TaskBulkDeleteView.as_view(), name='task_bulk_delete'),
+]
+
+# カテゴリ関連のURL
+# 例: config/urls.py で path('categories/', include(category_patterns)) とあれば、'create/' は '/categories/create/' になる
+category_patterns = [
+    # カテゴリ一覧ページ
+    path('', views.CategoryListView.as_view(), name='category_list'),
     
-    # タスク復元 (ゴミ箱内のタスクを指定ID <pk> で復元)
-    path('trash/<int:pk>/restore/', views.TaskRestoreView.as_view(), name='task_restore'),
+    # カテゴリ作成ページ
+    path('create/', views.CategoryCreateView.as_view(), name='category_create'),
     
-    # タスク一括物理削除 (チェックされたタスク、またはゴミ箱内の全てのタスクを完全に削除)
-    path('trash/bulk-delete/', views.TaskBulkDeleteView.as_view(), name='task_bulk_delete'),
+    # カテゴリ削除処理
+    path('delete/<int:pk>/', views.CategoryDeleteView.as_view(), name='category_delete'),
 ]
\ No newline at end of file
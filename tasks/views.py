@@ -1,4 +1,4 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.views.generic import (
     CreateView, 
     ListView, 
@@ -9,13 +9,13 @@ from django.views.generic import (
 from django.urls import reverse_lazy, reverse
 from django.contrib.auth.mixins import LoginRequiredMixin # ログイン必須を強制するMixin
 from django.views import View # カスタムなPOST処理を行うために使用
-from django.http import HttpResponseRedirect
+from django.http import HttpResponseRedirect, Http404
 from django.utils import timezone # 削除日時を記録するために使用
 
 from .forms import UserRegisterForm, TaskForm, CategoryForm, UserProfileEditForm
 from .models import Task, Category
 # ORMの複雑なクエリ（Case, When, Qなど）に必要なモジュール
-from django.db.models import Case, When, Value, BooleanField, IntegerField, Q 
+from django.db.models import Case, When, Value, IntegerField, Q, Count, F 
 from django.contrib.auth import get_user_model
 from django.contrib.auth import logout as auth_logout
 
@@ -23,6 +23,27 @@ from django.contrib.auth import logout as auth_logout
 # 認証・ユーザーモデルの取得
 User = get_user_model()
 
+# 有効な進捗状況の値 (STATUS_CHOICES は不変のため、リクエストごとに作り直さずモジュール読み込み時に一度だけ生成する)
+_VALID_STATUSES = frozenset(choice[0] for choice in Task.STATUS_CHOICES)
+
+# タスクIDとして有効な最大値 (主キーは BigAutoField のため、64ビット符号付き整数の上限)
+_MAX_TASK_ID = 2 ** 63 - 1
+
+# タスク一覧の並び替えで使う式 (リクエストごとに組み立てず、モジュール読み込み時に一度だけ生成する)
+# 📝 Note: ORMは annotate() に渡された式を内部で複製して使うため、共有しても安全
+# priority文字列を数値 ('high': 3, 'low': 1など) にマッピングする式
+PRIORITY_ORDER_CASE = Case(
+    When(priority='high', then=Value(3)),
+    When(priority='medium', then=Value(2)),
+    When(priority='low', then=Value(1)),
+    When(priority='none', then=Value(0)),
+    default=Value(0),
+    output_field=IntegerField()
+)
+# 期限 (due_date) の並び順 (期限なしのNULL値を、昇順では最後に、降順では最初に並べる)
+DUE_DATE_ASC = F('due_date').asc(nulls_last=True)
+DUE_DATE_DESC = F('due_date').desc(nulls_first=True)
+
 # ==============================================================================
 # 1. ユーザー認証関連ビュー (Authentication Views)
 # ==============================================================================
@@ -47,30 +68,65 @@ class TaskListView(LoginRequiredMixin, ListView):
     model = Task
     context_object_name = 'tasks' # テンプレートでアクセスする変数名
     template_name = 'tasks/home.html'
+    paginate_by = 50 # 1ページあたりの表示件数 (タスクが増えても1回に取得する行数を抑える)
     
+    def paginate_queryset(self, queryset, page_size):
+        """
+        範囲外・不正なページ番号を 404 にせず、最も近い有効なページに丸めてページ分割する。
+        (ステータス変更や削除後のリダイレクトは page を含む元のクエリを引き継ぐため、
+         最後のページが空になった場合でも一覧を表示できるようにする)
+        """
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        page = paginator.get_page(self.request.GET.get(self.page_kwarg))
+        return (paginator, page, page.object_list, page.has_other_pages())
+
     def get_queryset(self):
         """データベースから取得するクエリセットをカスタマイズする。"""
         # 1. 基本クエリ: ログインユーザーが所有し、かつ論理削除されていないタスクのみ
-        queryset = Task.objects.filter(
+        # 一覧で task.category.name を表示するため、カテゴリをJOINで同時に取得する（N+1クエリの防止）
+        # 一覧で表示・並び替えに使うカラムだけを読み込み、1行あたりのデータ量を減らす
+        # (description や deleted_at など一覧で使わないカラムは取得しない)
+        queryset = Task.objects.select_related('category').only(
+            'id', 'title', 'due_date', 'status', 'priority', 'created_at',
+            'category', 'category__name',
+        ).filter(
             user=self.request.user, 
             is_deleted=False
         )
         
-        # URLクエリパラメータの取得
-        category_id = self.request.GET.get('category')
-        status_filter = self.request.GET.get('status')
-        priority_filter = self.request.GET.get('priority')
-        search_query = self.request.GET.get('q')
+        # URLクエリパラメータの取得 (request.GET は一度だけ参照し、まとめて取り出す)
+        params = self.request.GET
+        category_id = params.get('category')
+        status_filter = params.get('status')
+        priority_filter = params.get('priority')
+        search_query = params.get('q')
+        sort_key = params.get('sort', 'due_date') # デフォルトは期限
+        order = params.get('order', 'asc') # デフォルトは昇順
+
+        # 💡 get_context_data で同じ値を再取得しないよう、取り出した値を保持しておく
+        self._parsed_params = {
+            'category': category_id,
+            'status': status_filter,
+            'priority': priority_filter,
+            'q': search_query,
+            'sort': sort_key,
+            'order': order,
+        }
 
         # 2. カテゴリフィルタリング
         if category_id:
             if category_id == 'none': # URLに 'category=none' が指定された場合
                 queryset = queryset.filter(category__isnull=True) # カテゴリがNULLのタスクをフィルタ
-            elif category_id.isdigit():
+            elif category_id.isdecimal():
                 queryset = queryset.filter(category__id=category_id) # 特定のカテゴリIDでフィルタ
         
         # 3. 進捗状況フィルタリング
-        if status_filter and status_filter.isdigit():
+        if status_filter and status_filter.isdecimal():
             # URLパラメータは文字列なので、整数に変換してフィルタリング
             queryset = queryset.filter(status=int(status_filter))
 
@@ -82,14 +138,12 @@ class TaskListView(LoginRequiredMixin, ListView):
         # 5. 検索フィルタリング
         if search_query:
             # Qオブジェクトを使用して、タイトル または 詳細 のいずれかにクエリ文字列が含まれるタスクをフィルタ
+            # (PostgreSQL ではマイグレーション 0009 のトライグラムインデックスが、この部分一致検索に使われる)
             queryset = queryset.filter(
                 Q(title__icontains=search_query) | Q(description__icontains=search_query)
             )
 
         # 6. 並び替えロジックの適用
-        sort_key = self.request.GET.get('sort', 'due_date') # デフォルトは期限
-        order = self.request.GET.get('order', 'asc') # デフォルトは昇順
-        
         # 有効なソートキーのリスト
         valid_sort_keys = {
             'due_date': 'due_date',
@@ -106,16 +160,7 @@ class TaskListView(LoginRequiredMixin, ListView):
             # --- 優先度によるカスタムソート処理 (文字列フィールドの順序付け) ---
             if sort_key == 'priority':
                 # Case/Whenを使用して、priority文字列を数値 ('high': 3, 'low': 1など) にマッピングするカスタムフィールドを追加
-                queryset = queryset.annotate(
-                    priority_order=Case(
-                        When(priority='high', then=Value(3)),
-                        When(priority='medium', then=Value(2)),
-                        When(priority='low', then=Value(1)),
-                        When(priority='none', then=Value(0)),
-                        default=Value(0),
-                        output_field=IntegerField()
-                    )
-                )
+                queryset = queryset.annotate(priority_order=PRIORITY_ORDER_CASE)
 
                 if order == 'asc':
                     # 昇順ソート時: 優先度の低いもの(0)が先頭
@@ -126,21 +171,13 @@ class TaskListView(LoginRequiredMixin, ListView):
                     
             # --- 期限 (due_date) によるソート処理 (NULL値の扱いを制御) ---
             elif sort_key == 'due_date':
-                # NULL値（期限なし）を判別するためのカスタムフラグを付与
-                queryset = queryset.annotate(
-                    due_date_null=Case(
-                        When(due_date__isnull=True, then=Value(True)),
-                        default=Value(False),
-                        output_field=BooleanField()
-                    )
-                )
-
+                # NULLS LAST / NULLS FIRST 句で、期限なしの位置を直接指定する
                 if order == 'asc':
-                    # 昇順ソート時: 期限なし(True)を最後に持ってくるようにソート
-                    queryset = queryset.order_by('due_date_null', 'due_date', '-created_at')
+                    # 昇順ソート時: 期限なしを最後に持ってくるようにソート
+                    queryset = queryset.order_by(DUE_DATE_ASC, '-created_at')
                 else:
-                    # 降順ソート時: 期限なし(True)を最初に持ってくるようにソート
-                    queryset = queryset.order_by('-due_date_null', '-due_date', '-created_at') 
+                    # 降順ソート時: 期限なしを最初に持ってくるようにソート
+                    queryset = queryset.order_by(DUE_DATE_DESC, '-created_at') 
             
             # --- その他のフィールドによるソート処理 ---
             else:
@@ -151,14 +188,8 @@ class TaskListView(LoginRequiredMixin, ListView):
                 queryset = queryset.order_by(field_name, '-created_at') 
         else:
             # 無効なソートキーが指定された場合、またはデフォルトソート
-            # モデルに定義されたデフォルトのソート順 (due_dateのNULL制御) を適用
-            queryset = queryset.annotate(
-                due_date_null=Case(
-                    When(due_date__isnull=True, then=Value(True)),
-                    default=Value(False),
-                    output_field=BooleanField()
-                )
-            ).order_by('due_date_null', 'due_date', '-created_at')
+            # デフォルトのソート順 (期限の昇順、期限なしは最後) を適用
+            queryset = queryset.order_by(DUE_DATE_ASC, '-created_at')
 
         return queryset
 
@@ -167,34 +198,33 @@ class TaskListView(LoginRequiredMixin, ListView):
         context = super().get_context_data(**kwargs)
         
         # ログインユーザーが作成したカテゴリ一覧を取得し、テンプレートに渡す
-        context['categories'] = Category.objects.filter(user=self.request.user).order_by('name')
+        # (選択中カテゴリの特定にも使うため、ここで一度だけリストとして評価する)
+        categories = list(Category.objects.filter(user=self.request.user).order_by('name'))
+        context['categories'] = categories
         
         # 現在適用されているフィルタ/ソート情報を取得し、テンプレートに渡す
-        current_category_filter = self.request.GET.get('category')
+        # (get_queryset で取り出したクエリパラメータを再利用する)
+        params = self._parsed_params
+        current_category_filter = params['category']
         context['current_category_filter'] = current_category_filter 
 
-        # 選択されたカテゴリのオブジェクトを取得し、コンテキストに追加
-        if current_category_filter and current_category_filter.isdigit():
-            try:
-                context['selected_category'] = Category.objects.get(
-                    pk=current_category_filter, 
-                    user=self.request.user 
-                )
-            except Category.DoesNotExist:
-                context['selected_category'] = None
-        else:
-            context['selected_category'] = None
+        # 選択されたカテゴリのオブジェクトを、取得済みのカテゴリ一覧から探してコンテキストに追加
+        # (該当しない場合は None。追加のクエリは発行しない)
+        context['selected_category'] = next(
+            (category for category in categories if str(category.pk) == current_category_filter),
+            None
+        )
         
         # タスクの進捗状況の選択肢を渡す
         context['status_choices'] = Task.STATUS_CHOICES 
-        context['current_status_filter'] = self.request.GET.get('status')
+        context['current_status_filter'] = params['status']
         
         # 優先度の選択肢と現在のフィルタを渡す
         context['priority_choices'] = Task.PRIORITY_CHOICES
-        context['current_priority_filter'] = self.request.GET.get('priority')
+        context['current_priority_filter'] = params['priority']
 
         # 現在の検索キーワードを渡す
-        context['current_search_query'] = self.request.GET.get('q')
+        context['current_search_query'] = params['q']
 
         # テンプレートで使用する並び替え可能なフィールドのキーと表示名を定義
         context['sort_headers'] = {
@@ -205,8 +235,8 @@ class TaskListView(LoginRequiredMixin, ListView):
         }
 
         # 現在のソート情報をコンテキストに追加
-        context['current_sort_key'] = self.request.GET.get('sort', 'due_date')
-        context['current_order'] = self.request.GET.get('order', 'asc')
+        context['current_sort_key'] = params['sort']
+        context['current_order'] = params['order']
         
         return context
 
@@ -294,27 +324,36 @@ class TaskUpdateStatusView(LoginRequiredMixin, View):
     POSTリクエストのみを受け付け、処理後にタスク一覧へリダイレクトする。
     """
     def post(self, request, pk):
-        # 1. タスクオブジェクトを、IDとユーザーをキーに取得
-        task = get_object_or_404(Task, pk=pk, user=request.user)
+        # 1. 更新対象のタスクを、IDとユーザーをキーに絞り込む（オブジェクトの取得は行わない）
+        queryset = Task.objects.filter(pk=pk, user=request.user)
         
         # 2. POSTデータから新しいステータス値とフィルタパラメータを取得
         new_status = request.POST.get('new_status')
         filter_params = request.POST.get('filter_params', '') # リダイレクト時に元のフィルタを復元するため
         
+        updated = 0
         if new_status is not None:
             try:
                 # 3. 整数に変換してステータスを更新
                 new_status = int(new_status)
                 
                 # STATUS_CHOICES内に含まれる値かチェック
-                valid_statuses = [choice[0] for choice in Task.STATUS_CHOICES]
-                if new_status in valid_statuses:
-                    task.status = new_status
-                    task.save()
+                if new_status in _VALID_STATUSES:
+                    # SELECT + 全カラムの UPDATE ではなく、1回の UPDATE で必要なカラムのみ更新する
+                    # 既に同じステータスの場合は行を書き換えない（条件付き UPDATE で行ロックの時間を最小化）
+                    # (update() は auto_now を適用しないため、updated_at も明示的に設定する)
+                    updated = queryset.exclude(status=new_status).update(
+                        status=new_status,
+                        updated_at=timezone.now(),
+                    )
             except ValueError:
                 # 無効な値が渡された場合は無視（エラー処理は省略）
                 pass
 
+        # 更新されなかった場合、対象タスクが存在しなければ 404 を返す
+        if not updated and not queryset.exists():
+            raise Http404
+
         # 4. タスク一覧画面へリダイレクト（元のフィルタを付加）
         if filter_params:
             # ベースURL + ? + フィルタパラメータ
@@ -331,13 +370,16 @@ class TaskDeleteView(LoginRequiredMixin, View):
     GETリクエストではなくPOSTリクエストで処理を行う。
     """
     def post(self, request, pk):
-        # 削除対象のタスクを、IDとユーザーをキーに取得
-        task = get_object_or_404(Task, pk=pk, user=request.user)
-        
+        # 削除対象のタスク（IDとユーザーで特定）に対し、1回の UPDATE で
         # 論理削除フラグを True に設定し、削除日時を記録
-        task.is_deleted = True
-        task.deleted_at = timezone.now()
-        task.save()
+        now = timezone.now()
+        updated = Task.objects.filter(pk=pk, user=request.user).update(
+            is_deleted=True,
+            deleted_at=now,
+            updated_at=now,
+        )
+        if not updated:
+            raise Http404
         
         return HttpResponseRedirect(reverse_lazy('home'))
 
@@ -347,22 +389,29 @@ class TrashView(LoginRequiredMixin, ListView):
     model = Task
     context_object_name = 'tasks'
     template_name = 'tasks/trash.html'
+    paginate_by = 50 # 1ページあたりの表示件数
 
     def get_queryset(self):
         """ログインユーザーが所有し、論理削除されているタスクのみを取得する。"""
-        return Task.objects.filter(user=self.request.user, is_deleted=True).order_by('-deleted_at') # 削除日時が新しい順
+        # ゴミ箱では詳細 (description) を表示しないため、サイズの大きいTEXTカラムは読み込まない
+        # (並び替えは (user, is_deleted, deleted_at) の複合インデックスを逆順に走査して行われる)
+        return Task.objects.defer('description').filter(
+            user=self.request.user, is_deleted=True
+        ).order_by('-deleted_at') # 削除日時が新しい順
 
 # タスク復元ビュー
 class TaskRestoreView(LoginRequiredMixin, View):
     """ゴミ箱にあるタスクを復元（is_deleted=Falseに戻す）する。"""
     def post(self, request, pk):
-        # 復元対象のタスクを、IDとユーザーをキーに取得
-        task = get_object_or_404(Task, pk=pk, user=request.user)
-        
+        # 復元対象のタスク（IDとユーザーで特定）に対し、1回の UPDATE で
         # 論理削除フラグを False に戻し、削除日時をクリア
-        task.is_deleted = False
-        task.deleted_at = None 
-        task.save()
+        updated = Task.objects.filter(pk=pk, user=request.user).update(
+            is_deleted=False,
+            deleted_at=None,
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            raise Http404
         
         return HttpResponseRedirect(reverse_lazy('trash'))
 
@@ -380,7 +429,11 @@ class TaskBulkDeleteView(LoginRequiredMixin, View):
         )
         
         if task_ids:
-            # 特定のIDリストに含まれるタスクのみを物理削除
+            # IDを事前に整数へ変換（数値でない値・主キーの範囲外の値は無視する）
+            # (範囲外の値をそのまま IN 句に渡すと、データベース側でオーバーフローのエラーになる)
+            task_ids = [int(task_id) for task_id in task_ids if task_id.isdecimal()]
+            task_ids = [task_id for task_id in task_ids if 0 < task_id <= _MAX_TASK_ID]
+            # 特定のIDリストに含まれるタスクのみを、1回の DELETE ... WHERE id IN (...) で物理削除
             queryset.filter(pk__in=task_ids).delete()
         else:
             # task_idsがない場合、ゴミ箱内の全タスクを物理削除
@@ -401,7 +454,8 @@ class CategoryListView(LoginRequiredMixin, ListView):
 
     def get_queryset(self):
         """ログインユーザーが所有するカテゴリのみを取得する。"""
-        return Category.objects.filter(user=self.request.user)
+        # カテゴリごとのタスク数を集計して付与する（行ごとの COUNT クエリを1回の GROUP BY にまとめる）
+        return Category.objects.filter(user=self.request.user).annotate(task_count=Count('task'))
     
 # カテゴリ作成ビュー
 class CategoryCreateView(LoginRequiredMixin, CreateView):
@@ -520,15 +574,21 @@ def task_complete(request, pk):
     """
     指定されたID (pk) のタスクのステータスを「完了」(status=2) に設定し、一覧ページにリダイレクトする。
     """
-    task = get_object_or_404(Task, pk=pk, user=request.user)
-    
+    queryset = Task.objects.filter(pk=pk, user=request.user)
+
     # POSTリクエストであることを前提として処理
     if request.method == 'POST':
-        task.status = 2 # 完了ステータス (models.pyで定義した2)
-        task.save()
+        # タスクを取得せず、未完了の場合のみ1回の UPDATE で完了ステータス (models.pyで定義した2) に更新する
+        updated = queryset.exclude(status=2).update(status=2, updated_at=timezone.now())
+        # 更新されなかった場合（完了済み or 存在しない）、タスクが存在しなければ 404 を返す
+        if not updated and not queryset.exists():
+            raise Http404
         return redirect('home')
     
     # POST以外でアクセスされた場合も一覧へリダイレクト
+    # (存在しない・他のユーザーのタスクの場合は、POSTと同様に 404 を返す)
+    if not queryset.exists():
+        raise Http404
     return redirect('home')
 
 def logout_view(request):